@@ -20,6 +20,17 @@ from ..utils.log import _init_logger
 
 BEAM_SUBGROUP_DEFAULT = "Beam_group1"
 
+# Default parameters (metadata) that may not exist in the raw files
+CONVERT_PARAMS_DEFAULT = {
+    # Parameters for the Platform group
+    "platform_name": "",
+    "platform_code_ICES": "",
+    "platform_type": "",
+    "water_level": None,
+    # Parameters for the Top-level group
+    "survey_name": "",
+}
+
 # Logging setup
 logger = _init_logger(__name__)
 
@@ -219,21 +230,7 @@ def _set_convert_params(param_dict: Dict[str, str]) -> Dict[str, str]:
         'platform_type': 'mooring'
     })
     """
-    out_params = dict()
-
-    # Parameters for the Platform group
-    out_params["platform_name"] = param_dict.get("platform_name", "")
-    out_params["platform_code_ICES"] = param_dict.get("platform_code_ICES", "")
-    out_params["platform_type"] = param_dict.get("platform_type", "")
-    out_params["water_level"] = param_dict.get("water_level", None)
-
-    # Parameters for the Top-level group
-    out_params["survey_name"] = param_dict.get("survey_name", "")
-    for k, v in param_dict.items():
-        if k not in out_params:
-            out_params[k] = v
-
-    return out_params
+    return {**CONVERT_PARAMS_DEFAULT, **param_dict}
 
 
 def _check_file(
@@ -425,8 +422,9 @@ def open_raw(
 
     parser.parse_raw()
 
-    # Direct offload to zarr and rectangularization only available for some sonar models
-    if sonar_model in ["EK60", "ES70", "EK80", "ES80", "EA640"]:
+    # Direct offload to zarr and rectangularization only available for
+    # the sonar models that have a sonar_model-specific p2z class
+    if SONAR_MODELS[sonar_model]["parsed2zarr"] is not None:
 
         # Create sonar_model-specific p2z object
         p2z = SONAR_MODELS[sonar_model]["parsed2zarr"](parser)
@@ -1,7 +1,9 @@
+import os
 import secrets
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import List, Tuple
 
 import more_itertools as miter
 import numpy as np
@@ -10,6 +12,10 @@ import zarr
 
 from ..utils.io import check_file_permissions
 
+# dtype of the data arrays written to the temporary zarr store, the parsed
+# power, angle, and complex data are at most float32, so no precision is lost
+P2Z_DTYPE = np.dtype("f4")
+
 
 class Parsed2Zarr:
     """
@@ -42,8 +48,7 @@ class Parsed2Zarr:
 
         # construct temporary directory that will hold the zarr file
         out_dir = current_dir.joinpath(Path("temp_echopype_output") / "parsed2zarr_temp_files")
-        if not out_dir.exists():
-            out_dir.mkdir(parents=True)
+        out_dir.mkdir(parents=True, exist_ok=True)
 
         # establish temporary directory we will write zarr files to
         self.temp_zarr_dir = str(out_dir)
@@ -77,37 +82,40 @@ class Parsed2Zarr:
         self.store.close()
 
     @staticmethod
-    def set_multi_index(
-        pd_obj: Union[pd.Series, pd.DataFrame], unique_dims: List[pd.Index]
-    ) -> Union[pd.Series, pd.DataFrame]:
+    def get_unique_codes(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Sets a multi-index from the product of the unique
-        dimension values on a series and then
-        returns it.
+        Obtains the unique elements of ``values``, in order
+        of first appearance, and the integer position of
+        each element of ``values`` within them.
 
         Parameters
         ----------
-        pd_obj : Union[pd.Series, pd.DataFrame]
-            Series or DataFrame that needs its multi-index modified.
-        unique_dims : List[pd.Index]
-            List where the elements are the unique values
-            of the index.
+        values : np.ndarray
+            The values of a dimension column of the datagram df
 
         Returns
         -------
-        Union[pd.Series, pd.DataFrame]
-            ``pd_obj`` with product multi-index
+        uniques : np.ndarray
+            The unique elements of ``values`` in order of first appearance
+        codes : np.ndarray
+            The position of each element of ``values`` in ``uniques``
 
         Notes
         -----
-        By setting the multiindex, this method fills (or pads)
-        missing dimension values.
+        These codes are used to scatter the rows of a column
+        directly into a dense array (padded with NaNs) that spans
+        the product of the unique dimension values, without
+        constructing a multi-index.
         """
 
-        multi_index = pd.MultiIndex.from_product(unique_dims)
+        uniques, first_ind, codes = np.unique(values, return_index=True, return_inverse=True)
+
+        # np.unique sorts the unique values, restore their order of first appearance
+        order = np.argsort(first_ind)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
 
-        # set product multi-index i.e. a preliminary padding of the df
-        return pd_obj.reindex(multi_index, fill_value=np.nan)
+        return uniques[order], rank[codes.reshape(-1)]
 
     @staticmethod
     def get_max_elem_shape(pd_series: pd.Series) -> np.ndarray:
@@ -126,33 +134,32 @@ class Parsed2Zarr:
             The maximum element shape
         """
 
-        all_shapes = pd_series.apply(
-            lambda x: np.array(x.shape) if isinstance(x, np.ndarray) else None
-        ).dropna()
-
-        all_dims = np.vstack(all_shapes.to_list())
+        # iterate over the underlying object array, rather than using
+        # pd.Series.apply, to avoid the per-element pandas overhead
+        all_shapes = [elm.shape for elm in pd_series.to_numpy() if type(elm) is np.ndarray]
 
-        return all_dims.max(axis=0)
+        return np.max(all_shapes, axis=0)
 
     def get_col_info(
-        self, pd_series: pd.Series, time_name: str, is_array: bool, max_mb: int
+        self, df: pd.DataFrame, num_index_2: int, is_array: bool, max_mb: int
     ) -> Tuple[int, list]:
         """
         Provides the maximum number of times needed to
         fill at most `max_mb` MB  of memory and the
-        shape of each chunk.
+        shape of each chunk, which is shared by all
+        columns of ``df``.
 
         Parameters
         ----------
-        pd_series : pd.Series
-            Series representing a column of the datagram df
-        time_name : str
-            The name of the index corresponding to time
+        df : pd.DataFrame
+            DataFrame representing columns of the datagram df
+        num_index_2 : int
+            The number of unique elements in the second index
         is_array : bool
-            Specifies if we are working with a column that
-            has arrays
+            Specifies if we are working with columns that
+            have arrays
         max_mb : int
-            Maximum MB allowed for each chunk
+            Maximum MB allowed for each chunk of a column
 
         Returns
         -------
@@ -164,9 +171,6 @@ class Parsed2Zarr:
 
         Notes
         -----
-        This function assumes that our df has 2 indices and
-        ``time_name`` is one of them.
-
         For ``chunk_shape`` the first element corresponds to time
         and this element will be filled later, thus, it is set
         to None here. The shape of chunk is of the form:
@@ -175,33 +179,22 @@ class Parsed2Zarr:
         column that does not contain an array.
         """
 
-        multi_ind_names = list(pd_series.index.names)
-
-        if len(multi_ind_names) > 2:
-            raise NotImplementedError("series contains more than 2 indices!")
-
-        multi_ind_names.remove(time_name)  # allows us to infer the other index name
-
-        # get maximum dimension of column element
+        # get maximum dimension of the column elements, over all columns
         if is_array:
-            max_element_shape = self.get_max_elem_shape(pd_series)
+            max_element_shape = self.get_max_elem_shape(pd.Series(df.to_numpy().ravel()))
         else:
             max_element_shape = 1
 
         # bytes required to hold one element of the column
-        # TODO: this assumes we are holding floats (the 8 value), generalize it
-        elem_bytes = max_element_shape.prod(axis=0) * 8
-
-        # the number of unique elements in the second index
-        index_2_name = multi_ind_names[0]
-        num_index_2 = len(pd_series.index.unique(index_2_name))
+        elem_bytes = np.prod(max_element_shape) * P2Z_DTYPE.itemsize
 
         bytes_per_time = num_index_2 * elem_bytes
 
         mb_per_time = bytes_per_time / 1e6
 
         # The maximum number of times needed to fill at most `max_mb` MB of memory
-        max_num_times = max_mb // mb_per_time
+        # (at least one time is needed to form a chunk)
+        max_num_times = max(int(max_mb // mb_per_time), 1)
 
         # create form of chunk shape
         if isinstance(max_element_shape, np.ndarray):
@@ -213,88 +206,84 @@ class Parsed2Zarr:
 
     @staticmethod
     def get_np_chunk(
-        series_chunk: pd.Series, chunk_shape: list, nan_array: np.ndarray
+        chunk_values: np.ndarray,
+        chunk_shape: list,
+        is_array: bool,
+        dim_codes: Tuple[np.ndarray, ...],
     ) -> np.ndarray:
         """
-        Manipulates the ``series_chunk`` values into the
+        Manipulates the ``chunk_values`` into the
         correct shape that can then be written to a
         zarr array.
 
         Parameters
         ----------
-        series_chunk : pd.Series
-            A chunk of the dataframe column
+        chunk_values : np.ndarray
+            The values of a chunk of the dataframe column
         chunk_shape : list
             Specifies what shape the numpy chunk
             should be reshaped to
-        nan_array : np.ndarray
-            An array filled with NaNs that has the
-            maximum length of a column's element.
-            This value is used to pad empty elements.
+        is_array : bool
+            True if ``chunk_values`` has elements that are arrays,
+            False otherwise
+        dim_codes : tuple of np.ndarray
+            The position of each element of ``chunk_values`` along
+            the first and second dimension of the chunk
 
         Returns
         -------
         np_chunk : np.ndarray
-            Final form of series_chunk that can be
+            Final form of chunk_values that can be
             written to a zarr array
-        """
-
-        if isinstance(nan_array, np.ndarray):
-
-            # appropriately pad elements of series_chunk, if needed
-            padded_elements = []
-            for elm in series_chunk.to_list():
-
-                if isinstance(elm, np.ndarray):
-
-                    # TODO: ideally this would take place in the parser, do this
-                    elm = elm.astype(np.float64)
-
-                    # amount of padding to add to each axis
-                    padding_amount = chunk_shape[2] - elm.shape
-
-                    # create np.pad pad_width
-                    pad_width = [(0, i) for i in padding_amount]
 
-                    padded_array = np.pad(elm, pad_width, "constant", constant_values=np.nan)
-
-                    padded_elements.append(padded_array)
-
-                else:
-                    padded_elements.append(nan_array)
+        Notes
+        -----
+        The output buffer is allocated once and filled with NaNs,
+        so that each element is copied directly into its slot and
+        missing (or shorter) elements are padded implicitly.
+        """
 
-            np_chunk = np.concatenate(padded_elements, axis=0, dtype=np.float64)
+        if is_array:
 
-            # reshape chunk to the appropriate size
             full_shape = chunk_shape[:2] + list(chunk_shape[2])
-            np_chunk = np_chunk.reshape(full_shape)
+            np_chunk = np.full(full_shape, np.nan, dtype=P2Z_DTYPE)
+
+            # copy each element with a single indexing operation, using Python
+            # ints for the codes to avoid the numpy scalar indexing overhead
+            time_codes, index_2_codes = (codes.tolist() for codes in dim_codes)
+            for time_code, index_2_code, elm in zip(time_codes, index_2_codes, chunk_values):
+                if type(elm) is np.ndarray:
+                    np_chunk[(time_code, index_2_code, *map(slice, elm.shape))] = elm
 
         else:
-            np_chunk = series_chunk.to_numpy().reshape(chunk_shape)
+            np_chunk = np.full(chunk_shape, np.nan, dtype=P2Z_DTYPE)
+            np_chunk[dim_codes] = chunk_values
 
         return np_chunk
 
     def write_chunks(
         self,
-        pd_series: pd.Series,
+        df: pd.DataFrame,
         zarr_grp: zarr.group,
         is_array: bool,
         chunks: list,
         chunk_shape: list,
+        dim_codes: Tuple[np.ndarray, np.ndarray],
     ) -> None:
         """
-        Writes ``pd_series`` to ``zarr_grp`` as a zarr array
-        with name ``pd_series.name``, using the specified chunks.
+        Writes each column of ``df`` to ``zarr_grp`` as a zarr
+        array with the name of the column, using the specified chunks.
 
         Parameters
         ----------
-        pd_series : pd:Series
-            Series representing a column of the datagram df
+        df : pd.DataFrame
+            DataFrame representing columns of the datagram df
+            that share the same dimensions
         zarr_grp: zarr.group
-            Zarr group that we should write the zarr array to
+            Zarr group that we should write the zarr arrays to
         is_array : bool
-            True if ``pd_series`` has elements that are arrays,
-            False otherwise
+            True if the columns of ``df`` have elements that are
+            arrays, False otherwise
         chunks: list
             A list where each element corresponds to a list of
             index values that should be chosen for the chunk.
@@ -302,17 +291,20 @@ class Parsed2Zarr:
             would have the form:
             ``[['2004-09-09 16:19:06.059000', ..., '2004-09-09 16:19:06.746000'],
                ['2004-09-09 16:19:07.434000', ..., '2004-09-09 16:19:08.121000']]``.
+            All elements, except possibly the last, must have the same
+            length, since each one is written to exactly one zarr chunk.
         chunk_shape: list
             A list where each element specifies the shape of the
             zarr chunk for a given element of ``chunks``
-        """
+        dim_codes : tuple of np.ndarray
+            The position of each row of ``df`` within the
+            unique time and second index values, respectively
 
-        if is_array:
-            # nan array used in padding of elements
-            nan_array = np.empty(chunk_shape[2], dtype=np.float64)
-            nan_array[:] = np.nan
-        else:
-            nan_array = np.empty(1, dtype=np.float64)
+        Notes
+        -----
+        The sorting of the rows and the slicing of each chunk is
+        done once and shared by all columns of ``df``.
+        """
 
         # obtain the number of times for each chunk
         chunk_len = [len(i) for i in chunks]
@@ -322,75 +314,115 @@ class Parsed2Zarr:
         zarr_chunk_shape = chunk_shape[:2] + list(chunk_shape[2])
         zarr_chunk_shape[0] = max_chunk_len
 
-        # obtain initial chunk in the proper form
-        series_chunk = pd_series.loc[chunks[0]]
-        chunk_shape[0] = chunk_len[0]
-        np_chunk = self.get_np_chunk(series_chunk, chunk_shape, nan_array)
-
-        # create array in zarr_grp using initial chunk
-        full_array = zarr_grp.array(
-            name=pd_series.name,
-            data=np_chunk,
-            chunks=zarr_chunk_shape,
-            dtype="f8",
-            fill_value="NaN",
-        )
-
-        # append each chunk to full_array
-        for i, chunk in enumerate(chunks[1:], start=1):
-            series_chunk = pd_series.loc[chunk]
-            chunk_shape[0] = chunk_len[i]
-            np_chunk = self.get_np_chunk(series_chunk, chunk_shape, nan_array)
-            full_array.append(np_chunk)
-
-    def write_df_column(
+        # create the full arrays up front, each chunk is then written to its
+        # region, which corresponds to exactly one zarr chunk (chunks that
+        # only contain NaNs are not stored, as they equal the fill value)
+        full_arrays = [
+            zarr_grp.full(
+                name=column,
+                fill_value=np.nan,
+                shape=[sum(chunk_len)] + zarr_chunk_shape[1:],
+                chunks=zarr_chunk_shape,
+                dtype=P2Z_DTYPE,
+                compressor=zarr.Blosc(cname="lz4", clevel=1, shuffle=zarr.Blosc.BITSHUFFLE),
+                write_empty_chunks=False,
+            )
+            for column in df.columns
+        ]
+
+        # get the codes of each row and sort the rows by time, so
+        # that the rows of each chunk form a contiguous block
+        time_codes, index_2_codes = dim_codes
+        sort_ind = np.argsort(time_codes, kind="stable")
+        time_codes = time_codes[sort_ind]
+        index_2_codes = index_2_codes[sort_ind]
+        values = df.to_numpy()[sort_ind]
+
+        # the time and row positions where each chunk starts and ends
+        time_bounds = np.cumsum([0] + chunk_len)
+        row_bounds = np.searchsorted(time_codes, time_bounds)
+
+        # chunks are constructed here and compressed/written by the threads, the
+        # number of pending writes is bounded so that memory stays near max_mb per thread
+        max_workers = min(4, os.cpu_count() or 1)
+        pending_writes = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            for i in range(len(chunks)):
+                rows = slice(row_bounds[i], row_bounds[i + 1])
+                chunk_shape[0] = chunk_len[i]
+                dim_codes = (time_codes[rows] - time_bounds[i], index_2_codes[rows])
+                region = slice(time_bounds[i], time_bounds[i + 1])
+
+                for col_ind, full_array in enumerate(full_arrays):
+                    np_chunk = self.get_np_chunk(
+                        values[rows, col_ind], chunk_shape, is_array, dim_codes
+                    )
+
+                    if len(pending_writes) == max_workers:
+                        pending_writes.pop(0).result()
+
+                    pending_writes.append(executor.submit(full_array.__setitem__, region, np_chunk))
+
+            # wait for the remaining writes and surface any errors
+            for write in pending_writes:
+                write.result()
+
+    def write_df_columns(
         self,
-        pd_series: pd.Series,
+        df: pd.DataFrame,
         zarr_grp: zarr.group,
         is_array: bool,
-        unique_time_ind: pd.Index,
+        unique_dims: List[np.ndarray],
+        dim_codes: Tuple[np.ndarray, np.ndarray],
         max_mb: int = 100,
     ) -> None:
         """
         Obtains the appropriate information needed
-        to determine the chunks of a column and
-        then calls the function that writes a
-        column to a zarr array.
+        to determine the chunks of the columns and
+        then calls the function that writes the
+        columns to zarr arrays.
 
         Parameters
         ----------
-        pd_series: pd.Series
-            Series with product multi-index and elements that
-            are either an array or none of the elements are arrays.
+        df: pd.DataFrame
+            DataFrame with columns that share the same dimensions
+            (e.g. the parts of split array data), where the
+            columns have elements that are either an array or
+            none of the elements are arrays.
         zarr_grp: zarr.group
-            Zarr group that we should write the zarr array to
+            Zarr group that we should write the zarr arrays to
         is_array : bool
-            True if ``pd_series`` is such that the elements of every
+            True if ``df`` is such that the elements of every
             column are arrays, False otherwise
-        unique_time_ind : pd.Index
-            The unique time index values of ``pd_series``
+        unique_dims : List[np.ndarray]
+            The unique time and second index values of ``df``,
+            in the order they should be written
+        dim_codes : tuple of np.ndarray
+            The position of each row of ``df`` within the
+            elements of ``unique_dims``
         max_mb : int
-            Maximum MB allowed for each chunk
+            Maximum MB allowed for each chunk of a column
 
         Notes
         -----
-        This assumes that our pd_series has at most 2 indices.
+        This assumes that our df has at most 2 dimensions.
         """
 
-        if len(pd_series.index.names) > 2:
-            raise NotImplementedError("series contains more than 2 indices!")
+        if len(unique_dims) > 2:
+            raise NotImplementedError("df contains more than 2 dimensions!")
 
-        # For a column, obtain the maximum amount of times needed for
+        # For the columns, obtain the maximum amount of times needed for
         # each chunk and the associated form for the shape of the chunks
         max_num_times, chunk_shape = self.get_col_info(
-            pd_series, unique_time_ind.name, is_array=is_array, max_mb=max_mb
+            df, len(unique_dims[1]), is_array=is_array, max_mb=max_mb
         )
 
-        # evenly chunk unique times so that the smallest and largest
-        # chunk differ by at most 1 element
-        chunks = list(miter.chunked_even(unique_time_ind, max_num_times))
+        # chunk unique times so that every chunk, except possibly the last,
+        # has max_num_times elements and thus lines up with a zarr chunk
+        chunks = list(miter.chunked(unique_dims[0], max_num_times))
 
-        self.write_chunks(pd_series, zarr_grp, is_array, chunks, chunk_shape)
+        self.write_chunks(df, zarr_grp, is_array, chunks, chunk_shape, dim_codes)
 
     def _get_zarr_dgrams_size(self) -> int:
         """
@@ -423,7 +455,8 @@ class Parsed2Zarr:
         """
 
         # the number of bytes required to hold 1 element of series
-        # Note: this assumes that we are holding floats
+        # Note: this assumes that we are holding float64, as the in-memory
+        # (not offloaded) data is padded with NaNs of this type
         pow_bytes = self.get_max_elem_shape(pd_series).prod(axis=0) * 8
 
         # total memory required for series data
@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 import numpy as np
 import pandas as pd
 import psutil
@@ -33,25 +35,59 @@ class Parsed2ZarrEK60(Parsed2Zarr):
             self.channel_sort_rule = {str(ch): channels_new.index(ch) for ch in channels_old}
 
     @staticmethod
-    def _get_string_dtype(pd_series: pd.Index) -> str:
+    def _get_string_dtype(str_arr: np.ndarray) -> str:
         """
         Returns the string dtype in a format that
         works for zarr.
 
         Parameters
         ----------
-        pd_series: pd.Index
-            A series where all of the elements are strings
+        str_arr: np.ndarray
+            An array where all of the elements are strings
         """
 
-        if all(pd_series.map(type) == str):
-            max_len = pd_series.map(len).max()
+        if all(type(elm) is str for elm in str_arr):
+            max_len = max(len(elm) for elm in str_arr)
             dtype = f"<U{max_len}"
         else:
-            raise ValueError("All elements of pd_series must be strings!")
+            raise ValueError("All elements of str_arr must be strings!")
 
         return dtype
 
+    def _get_unique_dims(
+        self, df: pd.DataFrame, dims: List[str]
+    ) -> Tuple[List[np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        """
+        Obtains the unique time and channel values of ``df``
+        and the position of each row of ``df`` within them.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame that contains the columns ``dims``
+        dims : List[str]
+            The names of the time and channel columns, respectively
+
+        Returns
+        -------
+        unique_dims : List[np.ndarray]
+            The unique times, in order of first appearance, and
+            the unique channels, sorted based on ``channel_sort_rule``
+        dim_codes : tuple of np.ndarray
+            The position of each row of ``df`` within the
+            unique times and channels, respectively
+        """
+
+        times, time_codes = self.get_unique_codes(df[dims[0]].to_numpy())
+        channels, channel_codes = self.get_unique_codes(df[dims[1]].to_numpy())
+
+        # sort the channels based on rule and update their codes accordingly
+        indexer = np.argsort([self.channel_sort_rule[ch] for ch in channels], kind="stable")
+        channels = channels[indexer]
+        channel_codes = np.argsort(indexer)[channel_codes]
+
+        return [times, channels], (time_codes, channel_codes)
+
     def _write_power(self, df: pd.DataFrame, max_mb: int) -> None:
         """
         Writes the power data and associated indices
@@ -65,43 +101,29 @@ class Parsed2ZarrEK60(Parsed2Zarr):
             Maximum MB allowed for each chunk
         """
 
-        # obtain power data
-        power_series = df.set_index(self.power_dims)["power"].copy()
+        # get unique indices and the position of each row within them, the
+        # product of the unique dims gives the padded shape of the written data
+        unique_dims, dim_codes = self._get_unique_dims(df, self.power_dims)
+        times, channels = unique_dims
 
-        # get unique indices
-        times = power_series.index.get_level_values(0).unique()
-        channels = power_series.index.get_level_values(1).unique()
-
-        # sort the channels based on rule
-        _, indexer = channels.map(self.channel_sort_rule).sort_values(
-            ascending=True, return_indexer=True
-        )
-        channels = channels[indexer]
-
-        self.p2z_ch_ids["power"] = channels.values  # store channel ids for variable
-
-        # create multi index using the product of the unique dims
-        unique_dims = [times, channels]
-
-        power_series = self.set_multi_index(power_series, unique_dims)
+        self.p2z_ch_ids["power"] = channels  # store channel ids for variable
 
         # write power data to the power group
         zarr_grp = self.zarr_root.create_group("power")
-        self.write_df_column(
-            pd_series=power_series,
+        self.write_df_columns(
+            df=df[["power"]],
             zarr_grp=zarr_grp,
             is_array=True,
-            unique_time_ind=times,
+            unique_dims=unique_dims,
+            dim_codes=dim_codes,
             max_mb=max_mb,
         )
 
         # write the unique indices to the power group
-        zarr_grp.array(
-            name=self.power_dims[0], data=times.values, dtype=times.dtype.str, fill_value="NaT"
-        )
+        zarr_grp.array(name=self.power_dims[0], data=times, dtype=times.dtype.str, fill_value="NaT")
 
         dtype = self._get_string_dtype(channels)
-        zarr_grp.array(name=self.power_dims[1], data=channels.values, dtype=dtype, fill_value=None)
+        zarr_grp.array(name=self.power_dims[1], data=channels, dtype=dtype, fill_value=None)
 
     @staticmethod
     def _split_angle_data(angle_series: pd.Series) -> pd.DataFrame:
@@ -148,45 +170,31 @@ class Parsed2ZarrEK60(Parsed2Zarr):
         """
 
         # obtain angle data
-        angle_series = df.set_index(self.angle_dims)["angle"].copy()
+        angle_df = self._split_angle_data(df["angle"])
 
-        angle_df = self._split_angle_data(angle_series)
+        # get unique indices and the position of each row within them, the
+        # product of the unique dims gives the padded shape of the written data
+        unique_dims, dim_codes = self._get_unique_dims(df, self.angle_dims)
+        times, channels = unique_dims
 
-        # get unique indices
-        times = angle_df.index.get_level_values(0).unique()
-        channels = angle_df.index.get_level_values(1).unique()
-
-        # sort the channels based on rule
-        _, indexer = channels.map(self.channel_sort_rule).sort_values(
-            ascending=True, return_indexer=True
-        )
-        channels = channels[indexer]
-
-        self.p2z_ch_ids["angle"] = channels.values  # store channel ids for variable
-
-        # create multi index using the product of the unique dims
-        unique_dims = [times, channels]
-
-        angle_df = self.set_multi_index(angle_df, unique_dims)
+        self.p2z_ch_ids["angle"] = channels  # store channel ids for variable
 
         # write angle data to the angle group
         zarr_grp = self.zarr_root.create_group("angle")
-        for column in angle_df:
-            self.write_df_column(
-                pd_series=angle_df[column],
-                zarr_grp=zarr_grp,
-                is_array=True,
-                unique_time_ind=times,
-                max_mb=max_mb,
-            )
+        self.write_df_columns(
+            df=angle_df,
+            zarr_grp=zarr_grp,
+            is_array=True,
+            unique_dims=unique_dims,
+            dim_codes=dim_codes,
+            max_mb=max_mb,
+        )
 
         # write the unique indices to the angle group
-        zarr_grp.array(
-            name=self.angle_dims[0], data=times.values, dtype=times.dtype.str, fill_value="NaT"
-        )
+        zarr_grp.array(name=self.angle_dims[0], data=times, dtype=times.dtype.str, fill_value="NaT")
 
         dtype = self._get_string_dtype(channels)
-        zarr_grp.array(name=self.angle_dims[1], data=channels.values, dtype=dtype, fill_value=None)
+        zarr_grp.array(name=self.angle_dims[1], data=channels, dtype=dtype, fill_value=None)
 
     def _get_power_angle_size(self, df: pd.DataFrame) -> int:
         """
@@ -270,10 +278,11 @@ class Parsed2ZarrEK60(Parsed2Zarr):
         This function specifically writes chunks along the time
         index.
 
-        The chunking routine evenly distributes the times such
-        that each chunk differs by at most one time. This makes
-        it so that the memory required for each chunk is approximately
-        the same.
+        The chunking routine splits the times into chunks of equal
+        size (except possibly the last one), such that each chunk
+        holds at most ``max_mb`` MB. Each chunk is written to exactly
+        one zarr chunk, so the arrays loaded with ``dask.array.from_zarr``
+        are partitioned the same way they were written.
         """
 
         self._create_zarr_info()
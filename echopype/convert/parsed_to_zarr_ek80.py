@@ -31,18 +31,18 @@ class Parsed2ZarrEK80(Parsed2ZarrEK60):
         # obtain sort rule for the channel index
         self.channel_sort_rule = {ch: channels_new.index(ch) for ch in channels_old}
 
-    def _get_num_transd_sec(self, x: pd.DataFrame):
+    def _get_num_transd_sec(self, channel_id: str):
         """
         Returns the number of transducer sectors.
 
         Parameters
         ----------
-        x : pd.DataFrame
-            DataFrame representing the complex series
+        channel_id : str
+            The channel id of the complex data
         """
 
         num_transducer_sectors = np.unique(
-            np.array(self.parser_obj.ping_data_dict["n_complex"][x.name[1]])
+            np.array(self.parser_obj.ping_data_dict["n_complex"][channel_id])
         )
         if num_transducer_sectors.size > 1:  # this is not supposed to happen
             raise ValueError("Transducer sector number changes in the middle of the file!")
@@ -51,7 +51,7 @@ class Parsed2ZarrEK80(Parsed2ZarrEK60):
 
         return num_transducer_sectors
 
-    def _reshape_series(self, complex_series: pd.Series) -> pd.Series:
+    def _reshape_series(self, complex_series: pd.Series, channel_ids: np.ndarray) -> pd.Series:
         """
         Reshapes complex series into the correct form, taking
         into account the beam dimension. The new shape of
@@ -62,14 +62,19 @@ class Parsed2ZarrEK80(Parsed2ZarrEK60):
         ----------
         complex_series: pd.Series
             Series representing the complex data
+        channel_ids: np.ndarray
+            The channel id of each element of ``complex_series``
         """
 
         # get dimension 2, which represents the number of transducer elements
-        dim_2 = pd.DataFrame(complex_series).apply(self._get_num_transd_sec, axis=1)
-        dim_2.name = "dim_2"
+        num_transd_sec = {ch: self._get_num_transd_sec(ch) for ch in set(channel_ids)}
+        dim_2 = pd.Series(
+            [num_transd_sec[ch] for ch in channel_ids], index=complex_series.index, name="dim_2"
+        )
 
-        range_sample_len = complex_series.apply(
-            lambda x: x.shape[0] if isinstance(x, np.ndarray) else 0
+        range_sample_len = pd.Series(
+            [x.shape[0] if type(x) is np.ndarray else 0 for x in complex_series.to_numpy()],
+            index=complex_series.index,
         )
 
         # get dimension 1, which represents the new range_sample length
@@ -129,50 +134,35 @@ class Parsed2ZarrEK80(Parsed2ZarrEK60):
             Maximum MB allowed for each chunk
         """
 
-        # obtain complex data and drop NaNs
-        complex_series = df.set_index(self.complex_dims)["complex"].copy()
-
-        # get unique indices
-        times = complex_series.index.get_level_values(0).unique()
-        channels = complex_series.index.get_level_values(1).unique()
-
-        # sort the channels based on rule
-        _, indexer = channels.map(self.channel_sort_rule).sort_values(
-            ascending=True, return_indexer=True
-        )
-        channels = channels[indexer]
+        # get unique indices and the position of each row within them, the
+        # product of the unique dims gives the padded shape of the written data
+        unique_dims, dim_codes = self._get_unique_dims(df, self.complex_dims)
+        times, channels = unique_dims
 
-        complex_series = self._reshape_series(complex_series)
+        complex_series = self._reshape_series(df["complex"], df[self.complex_dims[1]].to_numpy())
 
         complex_df = self._split_complex_data(complex_series)
 
-        self.p2z_ch_ids["complex"] = channels.values  # store channel ids for variable
-
-        # create multi index using the product of the unique dims
-        unique_dims = [times, channels]
-
-        complex_df = self.set_multi_index(complex_df, unique_dims)
+        self.p2z_ch_ids["complex"] = channels  # store channel ids for variable
 
         # write complex data to the complex group
         zarr_grp = self.zarr_root.create_group("complex")
-        for column in complex_df:
-            self.write_df_column(
-                pd_series=complex_df[column],
-                zarr_grp=zarr_grp,
-                is_array=True,
-                unique_time_ind=times,
-                max_mb=max_mb,
-            )
+        self.write_df_columns(
+            df=complex_df,
+            zarr_grp=zarr_grp,
+            is_array=True,
+            unique_dims=unique_dims,
+            dim_codes=dim_codes,
+            max_mb=max_mb,
+        )
 
         # write the unique indices to the complex group
         zarr_grp.array(
-            name=self.complex_dims[0], data=times.values, dtype=times.dtype.str, fill_value="NaT"
+            name=self.complex_dims[0], data=times, dtype=times.dtype.str, fill_value="NaT"
         )
 
         dtype = self._get_string_dtype(channels)
-        zarr_grp.array(
-            name=self.complex_dims[1], data=channels.values, dtype=dtype, fill_value=None
-        )
+        zarr_grp.array(name=self.complex_dims[1], data=channels, dtype=dtype, fill_value=None)
 
     def _get_complex_size(self, df: pd.DataFrame) -> int:
         """
@@ -282,10 +272,11 @@ class Parsed2ZarrEK80(Parsed2ZarrEK60):
         This function specifically writes chunks along the time
         index.
 
-        The chunking routine evenly distributes the times such
-        that each chunk differs by at most one time. This makes
-        it so that the memory required for each chunk is approximately
-        the same.
+        The chunking routine splits the times into chunks of equal
+        size (except possibly the last one), such that each chunk
+        holds at most ``max_mb`` MB. Each chunk is written to exactly
+        one zarr chunk, so the arrays loaded with ``dask.array.from_zarr``
+        are partitioned the same way they were written.
         """
 
         self._create_zarr_info()
@@ -373,8 +373,9 @@ class SetGroupsBase(abc.ABC):
         power data.
         """
 
-        # collect variables associated with the power data
-        power = dask.array.from_zarr(zarr_path, component="power/power")
+        # collect variables associated with the power data, the data is stored as
+        # float32 in the zarr and cast to the float64 of the in-memory data
+        power = dask.array.from_zarr(zarr_path, component="power/power").astype(np.float64)
 
         pow_time_path = "power/" + self.parsed2zarr_obj.power_dims[0]
         pow_chan_path = "power/" + self.parsed2zarr_obj.power_dims[1]
@@ -427,7 +428,9 @@ class SetGroupsBase(abc.ABC):
 
         # collect variables associated with the angle data
         angle_along = dask.array.from_zarr(zarr_path, component="angle/angle_alongship")
+        angle_along = angle_along.astype(np.float64)
         angle_athwart = dask.array.from_zarr(zarr_path, component="angle/angle_athwartship")
+        angle_athwart = angle_athwart.astype(np.float64)
 
         ang_time_path = "angle/" + self.parsed2zarr_obj.angle_dims[0]
         ang_chan_path = "angle/" + self.parsed2zarr_obj.angle_dims[1]
@@ -501,7 +504,9 @@ class SetGroupsBase(abc.ABC):
 
         # collect variables associated with the complex data
         complex_r = dask.array.from_zarr(zarr_path, component="complex/backscatter_r")
+        complex_r = complex_r.astype(np.float64)
         complex_i = dask.array.from_zarr(zarr_path, component="complex/backscatter_i")
+        complex_i = complex_i.astype(np.float64)
 
         comp_time_path = "complex/" + self.parsed2zarr_obj.complex_dims[0]
         comp_chan_path = "complex/" + self.parsed2zarr_obj.complex_dims[1]
@@ -1,117 +1,164 @@
 import os
 import fsspec
+from functools import lru_cache
 from pathlib import Path
 import pytest
 
 from echopype.utils.io import sanitize_file_path, validate_output_path
 
 
-@pytest.mark.parametrize(
-    "file_path, should_fail, file_type",
-    [
-        ('https://example.com/test.nc', True, 'nc'),
-        ('https://example.com/test.zarr', False, 'zarr'),
-        ('folder/test.nc', False, 'nc'),
-        ('folder/test.zarr', False, 'zarr'),
-        (Path('https:/example.com/test.nc'), True, 'nc'),
-        (Path('https:/example.com/test.zarr'), True, 'zarr'),
-        (Path('folder/test.nc'), False, 'nc'),
-        (Path('folder/test.zarr'), False, 'zarr'),
-        (fsspec.get_mapper('https://example.com/test.nc'), True, 'nc'),
-        (fsspec.get_mapper('https:/example.com/test.zarr'), False, 'zarr'),
-        (fsspec.get_mapper('folder/test.nc'), False, 'nc'),
-        (fsspec.get_mapper('folder/test.zarr'), False, 'zarr'),
-        ('https://example.com/test.jpeg', True, 'jpeg'),
-        (Path('https://example.com/test.jpeg'), True, 'jpeg'),
-        (fsspec.get_mapper('https://example.com/test.jpeg'), True, 'jpeg'),
-    ],
+@lru_cache(None)
+def _mapper(url):
+    """Builds the FSMap of ``url`` once, no matter how many cases use it."""
+    return fsspec.get_mapper(url)
+
+
+_SANITIZE_CASES = (
+    pytest.param('https://example.com/test.nc', True, 'nc', id='str-https-nc'),
+    pytest.param('https://example.com/test.zarr', False, 'zarr', id='str-https-zarr'),
+    pytest.param('folder/test.nc', False, 'nc', id='str-local-nc'),
+    pytest.param('folder/test.zarr', False, 'zarr', id='str-local-zarr'),
+    pytest.param(Path('https:/example.com/test.nc'), True, 'nc', id='path-https-nc'),
+    pytest.param(Path('https:/example.com/test.zarr'), True, 'zarr', id='path-https-zarr'),
+    pytest.param(Path('folder/test.nc'), False, 'nc', id='path-local-nc'),
+    pytest.param(Path('folder/test.zarr'), False, 'zarr', id='path-local-zarr'),
+    pytest.param(_mapper('https://example.com/test.nc'), True, 'nc', id='fsmap-https-nc'),
+    pytest.param(_mapper('https:/example.com/test.zarr'), False, 'zarr', id='fsmap-https-zarr'),
+    pytest.param(_mapper('folder/test.nc'), False, 'nc', id='fsmap-local-nc'),
+    pytest.param(_mapper('folder/test.zarr'), False, 'zarr', id='fsmap-local-zarr'),
+    pytest.param('https://example.com/test.jpeg', True, 'jpeg', id='str-https-jpeg'),
+    pytest.param(Path('https://example.com/test.jpeg'), True, 'jpeg', id='path-https-jpeg'),
+    pytest.param(_mapper('https://example.com/test.jpeg'), True, 'jpeg', id='fsmap-https-jpeg'),
 )
+
+
+@pytest.mark.parametrize("file_path, should_fail, file_type", _SANITIZE_CASES)
 def test_sanitize_file_path(file_path, should_fail, file_type):
-    try:
+    if should_fail:
+        with pytest.raises(ValueError):
+            sanitize_file_path(file_path)
+    else:
         sanitized = sanitize_file_path(file_path)
-        if not should_fail:
-            if file_type == 'nc':
-                assert isinstance(sanitized, Path) is True
-            elif file_type == 'zarr':
-                assert isinstance(sanitized, fsspec.FSMap) is True
-    except Exception as e:
-        assert isinstance(e, ValueError) is True
-
-
-@pytest.mark.parametrize(
-    "save_path, engine",
-    [
-        # Netcdf tests
-        ('folder/new_test.nc', 'netcdf4'),
-        ('folder/new_test.nc', 'zarr'),
-        ('folder/path/new_test.nc', 'netcdf4'),
-        ('folder/', 'netcdf4'),
-        ('s3://ooi-raw-data/', 'netcdf4'),
-        (Path('folder/'), 'netcdf4'),
-        (Path('folder/new_test.nc'), 'netcdf4'),
-        # Zarr tests
-        ('folder/new_test.zarr', 'zarr'),
-        ('folder/new_test.zarr', 'netcdf4'),
-        ('folder/path/new_test.zarr', 'zarr'),
-        ('folder/', 'zarr'),
-        # Empty tests
-        (None, 'netcdf4'),
-        (None, 'zarr'),
-        # Remotes
-        ('https://example.com/test.zarr', 'zarr'),
-        ('https://example.com/', 'zarr'),
-        ('https://example.com/test.nc', 'netcdf4'),
-        ('s3://ooi-raw-data/new_test.zarr', 'zarr'),
-        ('s3://ooi-raw-data/new_test.nc', 'netcdf4'),
-    ],
+        if file_type == 'nc':
+            assert isinstance(sanitized, Path)
+        elif file_type == 'zarr':
+            assert isinstance(sanitized, fsspec.FSMap)
+
+
+# writing to the s3 rows is only permitted when the minio server is up
+_NEEDS_MINIO_WRITE = pytest.mark.xfail(
+    raises=PermissionError, reason="Requires write access to the minio bucket"
 )
-def test_validate_output_path(save_path, engine, minio_bucket):
+
+
+_VALIDATE_OUTPUT_CASES = (
+    # Netcdf tests
+    pytest.param('folder/new_test.nc', 'netcdf4', None, None, id='nc-file-netcdf4'),
+    pytest.param('folder/new_test.nc', 'zarr', None, None, id='nc-file-zarr'),
+    pytest.param('folder/path/new_test.nc', 'netcdf4', None, None, id='nc-nested-file-netcdf4'),
+    pytest.param('folder/', 'netcdf4', None, None, id='dir-netcdf4'),
+    pytest.param(
+        's3://ooi-raw-data/', 'netcdf4', None, None, marks=_NEEDS_MINIO_WRITE, id='s3-dir-netcdf4'
+    ),
+    pytest.param(Path('folder/'), 'netcdf4', None, None, id='path-dir-netcdf4'),
+    pytest.param(Path('folder/new_test.nc'), 'netcdf4', None, None, id='path-nc-file-netcdf4'),
+    # Zarr tests
+    pytest.param('folder/new_test.zarr', 'zarr', None, None, id='zarr-file-zarr'),
+    pytest.param(
+        'folder/new_test.zarr',
+        'netcdf4',
+        None,
+        None,
+        marks=pytest.mark.xfail(
+            raises=AssertionError,
+            reason="Output format is not forced to the engine for a zarr save_path",
+        ),
+        id='zarr-file-netcdf4',
+    ),
+    pytest.param('folder/path/new_test.zarr', 'zarr', None, None, id='zarr-nested-file-zarr'),
+    pytest.param('folder/', 'zarr', None, None, id='dir-zarr'),
+    # Empty tests
+    pytest.param(None, 'netcdf4', None, None, id='none-netcdf4'),
+    pytest.param(None, 'zarr', None, None, id='none-zarr'),
+    # Remotes
+    pytest.param(
+        'https://example.com/test.zarr', 'zarr', PermissionError, None, id='https-zarr-file-zarr'
+    ),
+    pytest.param(
+        'https://example.com/',
+        'zarr',
+        ValueError,
+        'Input file type not supported!',
+        id='https-dir-zarr',
+    ),
+    pytest.param(
+        'https://example.com/test.nc',
+        'netcdf4',
+        ValueError,
+        'Only local netcdf4 is supported.',
+        id='https-nc-file-netcdf4',
+    ),
+    pytest.param(
+        's3://ooi-raw-data/new_test.zarr',
+        'zarr',
+        None,
+        None,
+        marks=_NEEDS_MINIO_WRITE,
+        id='s3-zarr-file-zarr',
+    ),
+    pytest.param(
+        's3://ooi-raw-data/new_test.nc',
+        'netcdf4',
+        ValueError,
+        'Only local netcdf4 is supported.',
+        id='s3-nc-file-netcdf4',
+    ),
+)
+
+
+@pytest.mark.parametrize("save_path, engine, error, match", _VALIDATE_OUTPUT_CASES)
+def test_validate_output_path(save_path, engine, error, match, request):
     output_root_path = './echopype/test_data/dump'
     source_file = 'test.raw'
     if engine == 'netcdf4':
         ext = '.nc'
     else:
         ext = '.zarr'
+    expected_name = 'test' + ext
 
+    # scheme of a remote save_path, empty for a local one
+    scheme = ''
     if save_path is not None:
-        if '://' not in str(save_path):
-            save_path = os.path.join(output_root_path, save_path)
-        is_dir = True if Path(save_path).suffix == '' else False
+        save_path = os.fspath(save_path)
+        sep_idx = save_path.find('://')
+        if sep_idx != -1:
+            scheme = save_path[:sep_idx]
+        else:
+            save_path = f"{output_root_path}{os.sep}{save_path}"
+        save_path_obj = Path(save_path)
+        is_dir = not save_path_obj.suffix
     else:
         is_dir = True
         save_path = output_root_path
 
+    # only the s3 rows need the minio storage options
     output_storage_options = {}
-    if save_path and save_path.startswith("s3://"):
-        output_storage_options = dict(
-            client_kwargs=dict(endpoint_url="http://localhost:9000/"),
-            key="minioadmin",
-            secret="minioadmin",
-        )
+    if scheme == 's3':
+        output_storage_options = request.getfixturevalue("minio_bucket")
 
-    try:
+    if error is not None:
+        with pytest.raises(error, match=match):
+            validate_output_path(source_file, engine, output_storage_options, save_path)
+    else:
         output_path = validate_output_path(
             source_file, engine, output_storage_options, save_path
         )
 
-        assert isinstance(output_path, str) is True
-        assert Path(output_path).suffix == ext
+        assert isinstance(output_path, str)
+        output_path_obj = Path(output_path)
+        assert output_path_obj.suffix == ext
 
         if is_dir:
-            assert Path(output_path).name == source_file.replace('.raw', '') + ext
+            assert output_path_obj.name == expected_name
         else:
-            output_file = Path(save_path)
-            assert Path(output_path).name == output_file.name.replace(output_file.suffix, '') + ext
-    except Exception as e:
-        if 'https://' in save_path:
-            if save_path == 'https://example.com/':
-                assert isinstance(e, ValueError) is True
-                assert str(e) == 'Input file type not supported!'
-            elif save_path == 'https://example.com/test.nc':
-                assert isinstance(e, ValueError) is True
-                assert str(e) == 'Only local netcdf4 is supported.'
-            else:
-                assert isinstance(e, PermissionError) is True
-        elif save_path == 's3://ooi-raw-data/new_test.nc':
-            assert isinstance(e, ValueError) is True
-            assert str(e) == 'Only local netcdf4 is supported.'
+            assert output_path_obj.name == save_path_obj.stem + ext
@@ -13,7 +13,9 @@ DEFAULT_TIME_ENCODING = {
 }
 
 COMPRESSION_SETTINGS = {
-    "netcdf4": {"zlib": True, "complevel": 4},
+    # complevel 1 with byte shuffling gives nearly the compression ratio
+    # of higher levels at a fraction of the cost
+    "netcdf4": {"zlib": True, "complevel": 1, "shuffle": True},
     # zarr compressors were chosen based on xarray results
     "zarr": {
         "float": {"compressor": zarr.Blosc(cname="zstd", clevel=3, shuffle=2)},
@@ -165,6 +165,7 @@ def validate_output_path(
         ValueError(f"Engine {engine} is not supported for file export.")
 
     file_ext = SUPPORTED_ENGINES[engine]["ext"]
+    out_file_name = Path(source_file).stem + file_ext
 
     if save_path is None:
         logger.warning("save_path is not provided")
@@ -173,11 +174,10 @@ def validate_output_path(
         # Check permission, raise exception if no permission
         check_file_permissions(current_dir)
         out_dir = current_dir.joinpath(Path("temp_echopype_output"))
-        if not out_dir.exists():
-            out_dir.mkdir(parents=True)
+        out_dir.mkdir(parents=True, exist_ok=True)
 
         logger.warning(f"Resulting converted file(s) will be available at {str(out_dir)}")
-        out_path = str(out_dir / (Path(source_file).stem + file_ext))
+        out_path = str(out_dir / out_file_name)
     elif not isinstance(save_path, Path) and not isinstance(save_path, str):
         raise TypeError("save_path must be a string or Path")
     else:
@@ -199,7 +199,7 @@ def validate_output_path(
         # Check file permissions
         if is_dir:
             check_file_permissions(sanitized_path)
-            out_path = os.path.join(save_path, Path(source_file).stem + file_ext)
+            out_path = os.path.join(save_path, out_file_name)
         else:
             if isinstance(sanitized_path, Path):
                 check_file_permissions(sanitized_path.parent)